@@ -2,7 +2,7 @@ import logging
 import os
 import sys
 from typing import Optional
-from .logger_style import LoggerStyle
+from .logger_style import LoggerStyle, StyleFormatter
 
 __all__ = [
     "CompactStyle",
@@ -17,9 +17,10 @@ class CompactStyle(LoggerStyle):
     where L is 1-letter level: D/I/W/E/C.
     Name is truncated to keep line width readable.
     Optional ANSI colors.
+    Pass time_fmt=None to drop the timestamp (e.g. when a collector adds its own).
     """
 
-    class _Formatter(logging.Formatter):
+    class _Formatter(StyleFormatter):
         LEVEL_CHAR = {
             logging.DEBUG: "D",
             logging.INFO: "I",
@@ -37,9 +38,12 @@ class CompactStyle(LoggerStyle):
         }
         RESET = "\033[0m"
 
-        def __init__(self, time_fmt: str = "%H:%M:%S", use_color: bool = False, name_width: int = 18):
-            fmt = "%(asctime)s %(levelchar)s %(shortname)s: %(message)s"
+        def __init__(self, time_fmt: Optional[str] = "%H:%M:%S", use_color: bool = False, name_width: int = 18):
+            fmt = "%(levelchar)s %(shortname)s: %(message)s"
+            if time_fmt:
+                fmt = "%(asctime)s " + fmt
             super().__init__(fmt=fmt, datefmt=time_fmt)
+            self.with_time = bool(time_fmt)
             self.use_color = use_color
             self.name_width = max(6, int(name_width))
 
@@ -52,6 +56,12 @@ class CompactStyle(LoggerStyle):
             right = keep - left
             return f"{base[:left]}…{base[-right:]}"
 
+        def formatMessage(self, record: logging.LogRecord) -> str:
+            # Same output as the fmt string, without the generic %-style substitution
+            if self.with_time:
+                return f"{record.asctime} {record.levelchar} {record.shortname}: {record.message}"
+            return f"{record.levelchar} {record.shortname}: {record.message}"
+
         def format(self, record: logging.LogRecord) -> str:
             record.levelchar = self.LEVEL_CHAR.get(record.levelno, "?")
             record.shortname = self._shorten_name(record.name)
@@ -64,7 +74,7 @@ class CompactStyle(LoggerStyle):
                     line = line.replace(prefix, colored, 1)
             return line
 
-    def __init__(self, *, time_fmt: str = "%H:%M:%S", use_color: Optional[bool] = None, name_width: int = 18) -> None:
+    def __init__(self, *, time_fmt: Optional[str] = "%H:%M:%S", use_color: Optional[bool] = None, name_width: int = 18) -> None:
         if use_color is None:
             use_color = os.getenv("LOGGER_COLOR", "1") not in ("0", "false", "False")
         self._time_fmt = time_fmt
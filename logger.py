@@ -1,12 +1,11 @@
 import logging
 import os
-import sys
 import threading
 import fcntl
 import atexit
 import queue
 from logging.handlers import QueueHandler, QueueListener
-from typing import Optional, Dict
+from typing import Any, Callable, Optional, Dict, List, Tuple, Union, cast
 from datetime import datetime
 from .logger_style import LoggerStyle, NormalStyle
 from .compact_style import CompactStyle, apply_style as apply_style_to_logger
@@ -20,40 +19,231 @@ _REGISTRY_LOCK = threading.Lock()
 DEFAULT_LOG_DIR = "logs"  # Default directory for log files; can be overridden via LOG_FILE_PATH_OVERRIDE
 LOG_TO_FILE_OVERRIDE = False  # Set to True to force all loggers to log to file, False to respect individual settings
 LOG_FILE_PATH_OVERRIDE: Optional[str] = None  # Set to a file path string to override all loggers' file paths
-LEVEL_OVERRIDE: Optional[str] = None  # Set to a logging level string (e.g., "DEBUG") to override all loggers' levels
+LEVEL_OVERRIDE: Optional[Union[str, int]] = None  # Set to a logging level (e.g., "DEBUG") to override all loggers' levels
+LOG_DEBUG_ENABLED = os.getenv("ADHD_LOG_DEBUG", "1") not in ("0", "false", "False")  # False turns log_debug() into a no-op
+
+_LEVELS: Dict[str, int] = {
+    "NOTSET": logging.NOTSET,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "FATAL": logging.CRITICAL,
+    "CRITICAL": logging.CRITICAL,
+}
+
+def _level_no(level: Union[str, int]) -> int:
+    """Map a level number or name to its number; unknown names fall back to INFO."""
+    if isinstance(level, int):
+        return level
+    return _LEVELS.get(level.upper(), logging.INFO)
+
+"""
+Background file writers: one queue + listener thread (and one open file) per
+absolute log file path, shared by every Logger that writes to that path.
+"""
+_FILE_LISTENERS: Dict[str, Tuple[queue.Queue, QueueListener]] = {}
+_FILE_LISTENER_USERS: Dict[str, int] = {}  # Attached Logger wrappers per path; the writer stops at 0
+_FILE_LISTENERS_LOCK = threading.Lock()
 
 class ConcurrentFileHandler(logging.FileHandler):
     """
     FileHandler that uses fcntl to ensure process safety on Linux.
-    Acquires an exclusive lock before writing and releases it immediately after.
+    By default every record is written immediately. With buffer_size > 0, formatted
+    records are buffered and written in a single locked write() once buffer_size
+    characters accumulate, a record at flush_level or above arrives, a record arrives
+    after the oldest buffered one is flush_interval seconds old, or flush() is called.
+    An idle buffer is not flushed on its own: its owner must call flush() (the per-path
+    file listener does so after every batch).
     """
-    def __init__(self, filename, mode='a', encoding=None, delay=False, use_lock=True):
+    def __init__(self, filename: str, mode: str = 'a', encoding: Optional[str] = None,
+                 delay: bool = False, use_lock: bool = True, buffer_size: int = 0,
+                 flush_level: int = logging.WARNING, flush_interval: float = 0.2) -> None:
         super().__init__(filename, mode, encoding, delay)
         self.use_lock = use_lock
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self._pending_since = 0.0  # record.created of the oldest buffered record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if not self._pending:
+                self._pending_since = record.created
+            self._pending.append(msg)
+            self._pending_size += len(msg)
+            if (self._pending_size >= self.buffer_size
+                    or record.levelno >= self.flush_level
+                    or record.created - self._pending_since >= self.flush_interval):
+                self._write_pending()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write out any buffered records."""
+        self.acquire()
+        try:
+            self._write_pending()
+        except Exception:
+            # No single record to blame: report the I/O error against the whole batch
+            self.handleError(logging.makeLogRecord(
+                {"msg": "buffered records for %s", "args": (self.baseFilename,)}))
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        # Flush first: FileHandler.close() skips flush() while the stream is still unopened (delay=True)
+        self.flush()
+        super().close()
 
-    def emit(self, record):
+    def _write_pending(self) -> None:
+        if not self._pending:
+            return
+        data = "".join(self._pending)
         try:
-            msg = self.format(record)
             stream = self.stream
+            if stream is None:
+                if self.mode == 'w' and getattr(self, "_closed", False):
+                    return  # Like FileHandler.emit: never reopen (and truncate) a closed 'w' file
+                stream = self.stream = self._open()
             
             # Acquire process lock (blocking)
             if self.use_lock:
                 fcntl.flock(stream.fileno(), fcntl.LOCK_EX)
             try:
-                stream.write(msg + self.terminator)
-                self.flush()
+                stream.write(data)
+                stream.flush()
             finally:
                 # Release process lock
                 if self.use_lock:
                     fcntl.flock(stream.fileno(), fcntl.LOCK_UN)
-        except Exception:
-            self.handleError(record)
+        finally:
+            # Cleared after the attempt either way: a failed batch is dropped (and reported by
+            # the caller) rather than retried with, and blocking, every later record
+            self._pending.clear()
+            self._pending_size = 0
+
+class _BatchingQueueListener(QueueListener):
+    """
+    QueueListener that handles every record already queued before flushing its
+    handlers, so a burst of records costs one write() instead of one per record.
+    A threading.Event put on the queue acts as a flush barrier: everything queued
+    before it is written out, then the event is set.
+    """
+    _sentinel = None  # Same value as QueueListener's (undeclared in typeshed)
+
+    def _monitor(self) -> None:
+        q = cast(queue.Queue, self.queue)  # Always a queue.Queue here (see _acquire_file_queue)
+        stopping = False
+        while not stopping:
+            record = self.dequeue(True)
+            while True:
+                if record is self._sentinel:
+                    stopping = True
+                elif isinstance(record, threading.Event):
+                    self._flush_handlers(None)
+                    record.set()
+                else:
+                    self.handle(record)
+                q.task_done()
+                if stopping:
+                    break
+                try:
+                    record = self.dequeue(False)
+                except queue.Empty:
+                    break
+            self._flush_handlers(record)
+
+    def _flush_handlers(self, record) -> None:
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except Exception:
+                # Never let a failing flush kill the writer thread for this path
+                handler.handleError(record)
+
+def _acquire_file_queue(path: str) -> Tuple[str, queue.Queue]:
+    """
+    Register a user of the background writer for path, starting it on first use.
+    Returns the normalized path (to pass to _release_file_queue) and the writer's queue.
+    """
+    # Key by absolute path (as FileHandler opens it) so "logs/x.log" and "./logs/x.log" share one writer
+    path = os.path.abspath(path)
+    with _FILE_LISTENERS_LOCK:
+        entry = _FILE_LISTENERS.get(path)
+        if entry is None:
+            # The listener thread owns the blocking file handler; producers only enqueue.
+            # Create logs directory once per writer (not per Logger construction)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Buffering is safe here because the listener flushes after every batch
+            file_handler = ConcurrentFileHandler(path, use_lock=True, buffer_size=65536)
+            file_handler.setFormatter(NormalStyle().create_formatter())
+            log_queue: queue.Queue = queue.Queue(-1)  # Infinite queue
+            listener = _BatchingQueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            entry = _FILE_LISTENERS[path] = (log_queue, listener)
+        _FILE_LISTENER_USERS[path] = _FILE_LISTENER_USERS.get(path, 0) + 1
+        return path, entry[0]
+
+def _release_file_queue(path: str) -> None:
+    """Drop one user of the writer for path; the last one drains and stops it and closes the file."""
+    with _FILE_LISTENERS_LOCK:
+        users = _FILE_LISTENER_USERS.get(path, 0) - 1
+        if users > 0:
+            _FILE_LISTENER_USERS[path] = users
+            return
+        _FILE_LISTENER_USERS.pop(path, None)
+        entry = _FILE_LISTENERS.pop(path, None)
+        if entry is not None:
+            _, listener = entry
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+def _flush_file_queue(log_queue: queue.Queue, timeout: float = 5.0) -> bool:
+    """
+    Wait until the writer for log_queue has written out everything queued so far.
+    Records queued after this call are not waited for. Returns False on timeout.
+    """
+    barrier = threading.Event()
+    with _FILE_LISTENERS_LOCK:
+        # Enqueued under the lock so a concurrent stop() puts its sentinel after the barrier
+        if not any(q is log_queue for q, _ in _FILE_LISTENERS.values()):
+            return True
+        log_queue.put_nowait(barrier)
+    return barrier.wait(timeout)
+
+def _stop_file_listeners() -> None:
+    """Drain pending records, stop all background writers and close their files."""
+    with _FILE_LISTENERS_LOCK:
+        for _, listener in _FILE_LISTENERS.values():
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        _FILE_LISTENERS.clear()
+        _FILE_LISTENER_USERS.clear()
+
+atexit.register(_stop_file_listeners)
 
 class Logger:
     """
     A centralized logger utility with pluggable styles (NormalStyle, CompactStyle).
     Per-name singleton: Logger(name="X") always returns the same wrapper.
+
+    Log methods take stdlib-style lazy arguments, e.g. log.info("path=%s id=%d", p, i),
+    so filtered-out messages are never formatted. Prefer this over f-strings.
     """
+
+    # Bound to the underlying logging.Logger methods in __init__
+    debug: Callable[..., None]
+    info: Callable[..., None]
+    warning: Callable[..., None]
+    error: Callable[..., None]
+    critical: Callable[..., None]
     
     def __new__(cls,
                 name: str = "Logger",
@@ -71,7 +261,7 @@ class Logger:
 
     def __init__(self, 
                  name: str = "Logger",
-                 level: Optional[str] = None, 
+                 level: Optional[Union[str, int]] = None, 
                  log_to_file: Optional[bool] = None,
                  log_file_path: Optional[str] = None,
                  verbose: Optional[bool] = None,
@@ -86,13 +276,23 @@ class Logger:
             # Immutable identity
             self.name = name
             # Defaults
-            self.level = logging.INFO 
+            self.level: int = logging.INFO 
             self.log_to_file = False
-            self.log_file_path = f"{DEFAULT_LOG_DIR}/{name}_{datetime.now().strftime('%Y%m%d')}.log"
-            self.style = CompactStyle()
+            self.log_file_path: Optional[str] = None  # None -> dated default, resolved only when file logging is set up
+            self.style: LoggerStyle = CompactStyle()
             # Underlying stdlib logger
             self.logger = logging.getLogger(self.name)
             self.logger.propagate = False  # Prevent duplicate logs from parent/root handlers
+            # Log methods are the stdlib logger's own bound methods: no wrapper frame per call,
+            # and caller info (funcName/lineno) points at the real call site
+            self.debug = self.logger.debug
+            self.info = self.logger.info
+            self.warning = self.logger.warning
+            self.error = self.logger.error
+            self.critical = self.logger.critical
+            # Settings the current handlers were built from
+            self._handler_config: Optional[Tuple[bool, Optional[str], LoggerStyle]] = None
+            self._file_writer_path: Optional[str] = None  # Path of the shared file writer in use, if any
             self._initialized = True
 
         # Apply configuration on first init or when any parameters are provided
@@ -105,12 +305,12 @@ class Logger:
 
     def configure(self,
                   *,
-                  level: Optional[str] = None,
+                  level: Optional[Union[str, int]] = None,
                   log_to_file: Optional[bool] = None,
                   log_file_path: Optional[str] = None,
                   verbose: Optional[bool] = None,
                   style: Optional[LoggerStyle] = None) -> None:
-        """Reconfigure logger settings and rebuild handlers."""
+        """Reconfigure logger settings; handlers are rebuilt only if a setting they depend on changed."""
         # Resolve effective level
         self.level = self._effective_level(current=self.level, level=level, verbose=verbose)
         self.logger.setLevel(self.level)
@@ -123,68 +323,65 @@ class Logger:
         if style is not None:
             self.style = style
 
-        # Rebuild handlers to reflect new config
+        # Rebuild handlers only if a setting they depend on actually changed
+        # (level is not part of it: filtering happens on the logger, so set_level never touches handlers)
+        to_file = bool(self.log_to_file or LOG_TO_FILE_OVERRIDE)
+        handler_config = (to_file,
+                          self._file_target() if to_file else None,
+                          self.style)
+        if handler_config == self._handler_config:
+            return
         self._rebuild_handlers()
+        self._handler_config = handler_config
 
     @staticmethod
-    def _effective_level(current: int, level: Optional[str], verbose: Optional[bool]) -> int:
-        """Resolve new level from current, level string, and verbose flag."""
+    def _effective_level(current: int, level: Optional[Union[str, int]], verbose: Optional[bool]) -> int:
+        """Resolve new level from current, level name or number, and verbose flag."""
         if LEVEL_OVERRIDE:
-            return getattr(logging, LEVEL_OVERRIDE.upper(), logging.INFO)
+            return _level_no(LEVEL_OVERRIDE)
 
         eff = current
         if level is not None:
-            eff = getattr(logging, level.upper(), logging.INFO)
+            eff = _level_no(level)
         if verbose is True:
             eff = logging.DEBUG
         return eff
 
     def _rebuild_handlers(self) -> None:
         """Clear handlers, apply console style, and optional file handler."""
-        # Stop existing listener if it exists to prevent resource leaks
-        if hasattr(self, "_listener") and self._listener:
-            self._listener.stop()
-            self._listener = None
-
-        self.logger.handlers.clear()
-        self._setup_console_handler()
-        if self.log_to_file or LOG_TO_FILE_OVERRIDE:
-            self._setup_file_handler()
+        previous_writer = self._file_writer_path
+        self._file_writer_path = None
+        try:
+            self.logger.handlers.clear()
+            self._setup_console_handler()
+            if self.log_to_file or LOG_TO_FILE_OVERRIDE:
+                self._setup_file_handler()
+        finally:
+            # Released after the new setup, so an unchanged path keeps its running writer,
+            # and released even if that setup fails, so the old writer cannot leak
+            if previous_writer is not None:
+                _release_file_queue(previous_writer)
     
-    def _setup_console_handler(self):
+    def _setup_console_handler(self) -> None:
         """Setup console handler for logging to stdout and apply style."""
         # A stream handler will be created by apply_style_to_logger if missing
         apply_style_to_logger(self.logger, self.style)
         
-    def _setup_file_handler(self):
+    def _file_target(self) -> str:
+        """Path the file handler writes to, honoring LOG_FILE_PATH_OVERRIDE."""
+        if LOG_FILE_PATH_OVERRIDE:
+            return LOG_FILE_PATH_OVERRIDE
+        if self.log_file_path:
+            return self.log_file_path
+        return f"{DEFAULT_LOG_DIR}/{self.name}_{datetime.now().strftime('%Y%m%d')}.log"
+
+    def _setup_file_handler(self) -> None:
         """Setup file handler for logging to file with normal verbose formatter."""
-        target_path = LOG_FILE_PATH_OVERRIDE if LOG_FILE_PATH_OVERRIDE else self.log_file_path
+        target_path = self._file_target()
 
-        # Create logs directory if it doesn't exist
-        log_dir = os.path.dirname(target_path)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir, exist_ok=True)
-        
-        # 1. Create the blocking file handler (but don't attach it to logger directly)
-        file_handler = ConcurrentFileHandler(target_path, use_lock=True)
-        file_handler.setLevel(self.level)
-        formatter = NormalStyle().create_formatter()
-        file_handler.setFormatter(formatter)
-        
-        # 2. Create a Queue and a QueueHandler
-        log_queue = queue.Queue(-1) # Infinite queue
+        # Records are enqueued here (no I/O) and written by the path's shared listener thread
+        self._file_writer_path, log_queue = _acquire_file_queue(target_path)
         queue_handler = QueueHandler(log_queue)
-        queue_handler.setLevel(self.level)
-        
-        # 3. Create and start the listener in a background thread
-        # The listener reads from queue -> writes to file_handler (blocking happens here)
-        self._listener = QueueListener(log_queue, file_handler)
-        self._listener.start()
-        
-        # 4. Ensure listener stops on exit to flush logs
-        atexit.register(self._listener.stop)
-        
-        # 5. Attach the non-blocking QueueHandler to the logger
         self.logger.addHandler(queue_handler)
     
     def get_logger(self) -> logging.Logger:
@@ -200,37 +397,20 @@ class Logger:
         """Change the console style at runtime for this logger."""
         self.style = style
         apply_style_to_logger(self.logger, self.style)
+        # Keep the recorded handler settings in step, so configure() compares against the live style
+        if self._handler_config is not None:
+            self._handler_config = self._handler_config[:2] + (style,)
     
-    def debug(self, message: str):
-        """Log a debug message."""
-        self.logger.debug(message)
-    
-    def info(self, message: str):
-        """Log an info message."""
-        self.logger.info(message)
-    
-    def warning(self, message: str):
-        """Log a warning message."""
-        self.logger.warning(message)
-    
-    def error(self, message: str):
-        """Log an error message."""
-        self.logger.error(message)
-    
-    def critical(self, message: str):
-        """Log a critical message."""
-        self.logger.critical(message)
-    
-    def set_level(self, level: str):
+    def set_level(self, level: Union[str, int]) -> None:
         """
         Change the logging level.
         
         Args:
-            level (str): New logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            level (str | int): New logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL) or its number
         """
         self.configure(level=level)
     
-    def add_custom_handler(self, handler: logging.Handler):
+    def add_custom_handler(self, handler: logging.Handler) -> None:
         """
         Add a custom handler to the logger.
         
@@ -239,13 +419,32 @@ class Logger:
         """
         self.logger.addHandler(handler)
     
-    def remove_all_handlers(self):
-        """Remove all handlers from the logger."""
+    def flush(self) -> None:
+        """
+        Write out everything logged so far, including records still queued for the log file.
+        Waits for the file writer at most a few seconds; later records are not waited for.
+        """
+        for handler in self.logger.handlers:
+            if isinstance(handler, QueueHandler) and isinstance(handler.queue, queue.Queue):
+                _flush_file_queue(handler.queue)
+            else:
+                handler.flush()
+
+    def remove_all_handlers(self) -> None:
+        """Flush and remove all handlers from the logger."""
+        self.flush()
         self.logger.handlers.clear()
+        self._handler_config = None
+        if self._file_writer_path is not None:
+            _release_file_queue(self._file_writer_path)
+            self._file_writer_path = None
 
 
-# Global centralized logger instance for debugging and special purposes
-_central_logger = None
+# Global centralized logger instance for debugging and special purposes.
+# Written once under _CENTRAL_LOCK and only read afterwards; deliberately process-wide
+# (a ContextVar would start empty in every new thread/context and rebuild it there).
+_central_logger: Optional[logging.Logger] = None
+_CENTRAL_LOCK = threading.Lock()
 
 def get_central_logger(verbose: bool = False, log_to_file: bool = True) -> logging.Logger:
     """
@@ -260,42 +459,49 @@ def get_central_logger(verbose: bool = False, log_to_file: bool = True) -> loggi
         logging.Logger: The centralized logger instance
     """
     global _central_logger
-    if _central_logger is None:
-        logger_instance = Logger(
-            name="CENTRAL",
-            verbose=verbose,
-            log_to_file=log_to_file,
-            log_file_path=f"{DEFAULT_LOG_DIR}/central_{datetime.now().strftime('%Y%m%d')}.log"
-        )
-        _central_logger = logger_instance.get_logger()
-    return _central_logger
-
-
-def set_logger_style(logger, style: Optional[LoggerStyle] = None) -> None:
+    central = _central_logger
+    if central is not None:
+        return central
+    with _CENTRAL_LOCK:
+        if _central_logger is None:
+            logger_instance = Logger(
+                name="CENTRAL",
+                verbose=verbose,
+                log_to_file=log_to_file,
+                log_file_path=f"{DEFAULT_LOG_DIR}/central_{datetime.now().strftime('%Y%m%d')}.log"
+            )
+            _central_logger = logger_instance.get_logger()
+        return _central_logger
+
+
+def set_logger_style(logger: Union["Logger", logging.Logger], style: Optional[LoggerStyle] = None) -> None:
     """Apply a console style to a logger (wrapper or std logging.Logger). Defaults to CompactStyle."""
-    target = logger
-    # Allow passing our Logger wrapper or a std logging.Logger
+    # Allow passing our Logger wrapper (restyled through set_style) or a std logging.Logger
     if isinstance(logger, Logger):
-        target = logger.get_logger()
-    apply_style_to_logger(target, style or CompactStyle())
+        logger.set_style(style or CompactStyle())
+    else:
+        apply_style_to_logger(logger, style or CompactStyle())
 
-# Convenience functions for central logger - no-brainer logging
-def log_debug(message: str):
-    """Quick debug logging to central logger."""
-    get_central_logger(verbose=True).debug(message)
+# Convenience functions for central logger - no-brainer logging.
+# Once built, the cached logger is used directly so each call skips get_central_logger().
+def log_debug(msg: object, *args: object, **kwargs: Any) -> None:
+    """Quick debug logging to central logger. No-op when LOG_DEBUG_ENABLED is False (ADHD_LOG_DEBUG=0)."""
+    if not LOG_DEBUG_ENABLED:
+        return
+    (_central_logger or get_central_logger(verbose=True)).debug(msg, *args, **kwargs)
 
-def log_info(message: str):
+def log_info(msg: object, *args: object, **kwargs: Any) -> None:
     """Quick info logging to central logger."""
-    get_central_logger().info(message)
+    (_central_logger or get_central_logger()).info(msg, *args, **kwargs)
 
-def log_warning(message: str):
+def log_warning(msg: object, *args: object, **kwargs: Any) -> None:
     """Quick warning logging to central logger."""
-    get_central_logger().warning(message)
+    (_central_logger or get_central_logger()).warning(msg, *args, **kwargs)
 
-def log_error(message: str):
+def log_error(msg: object, *args: object, **kwargs: Any) -> None:
     """Quick error logging to central logger."""
-    get_central_logger().error(message)
+    (_central_logger or get_central_logger()).error(msg, *args, **kwargs)
 
-def log_critical(message: str):
+def log_critical(msg: object, *args: object, **kwargs: Any) -> None:
     """Quick critical logging to central logger."""
-    get_central_logger().critical(message)
\ No newline at end of file
+    (_central_logger or get_central_logger()).critical(msg, *args, **kwargs)
\ No newline at end of file
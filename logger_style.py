@@ -1,12 +1,34 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import Optional, Tuple
 
 __all__ = [
     "LoggerStyle",
     "NormalStyle",
+    "StyleFormatter",
 ]
 
 
+class StyleFormatter(logging.Formatter):
+    """Formatter base for the built-in styles; renders asctime at most once per second."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._time_cache: Tuple[Optional[int], Optional[str], str] = (None, None, "")  # (second, datefmt, rendered)
+
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+        if datefmt is None:
+            # Default rendering includes milliseconds, so it changes on every record
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_fmt, rendered = self._time_cache
+        if second == cached_second and datefmt == cached_fmt:
+            return rendered
+        rendered = super().formatTime(record, datefmt)
+        self._time_cache = (second, datefmt, rendered)
+        return rendered
+
+
 class LoggerStyle(ABC):
     """Abstract base class for logger style/formatting."""
 
@@ -26,8 +48,13 @@ class NormalStyle(LoggerStyle):
     def __init__(self, *, datefmt: str = "%Y-%m-%d %H:%M:%S") -> None:
         self._datefmt = datefmt
 
+    class _Formatter(StyleFormatter):
+        def __init__(self, datefmt: str) -> None:
+            super().__init__(fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt=datefmt)
+
+        def formatMessage(self, record: logging.LogRecord) -> str:
+            # Same output as the fmt string, without the generic %-style substitution
+            return f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
+
     def create_formatter(self) -> logging.Formatter:
-        return logging.Formatter(
-            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt=self._datefmt,
-        )
+        return NormalStyle._Formatter(datefmt=self._datefmt)